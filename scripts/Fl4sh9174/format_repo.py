@@ -4,25 +4,69 @@ import shutil
 import re
 import sys
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_BRACKET_GROUP_RE = re.compile(r'\[(.*?)\]')
+_VERSION_SUFFIX_RE = re.compile(r' v[0-9.]+$')
+_STRIP_TABLE = str.maketrans('', '', "'’`\"")
+
+def strip_brackets(text):
+    # Most names carry no tags, so only run the regex when there is a bracket to remove
+    if '[' not in text:
+        return text
+    return _BRACKET_RE.sub('', text)
+
+@lru_cache(maxsize=4096)
 def sanitize_name(name):
-    # Normalize the name to remove accents and special characters
-    normalized_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
-    # Replace any remaining apostrophes and other unwanted characters
-    sanitized_name = normalized_name.replace("'", "").replace("’", "").replace("`", "").replace('"', '')
+    # Normalize the name to remove accents and special characters (ASCII names are already normalized)
+    if name.isascii():
+        normalized_name = name
+    else:
+        normalized_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    # Remove any remaining apostrophes and other unwanted characters in a single pass
+    sanitized_name = normalized_name.translate(_STRIP_TABLE)
     return sanitized_name
 
+def unzip_archives(extract_to, file_paths):
+    messages = []
+    for file_path in file_paths:
+        with zipfile.ZipFile(file_path, 'r') as zip_ref:
+            # Only the pchtxt files are kept, so skip writing everything else to disk
+            members = [info for info in zip_ref.infolist() if info.filename.endswith('.pchtxt')]
+            zip_ref.extractall(extract_to, members)
+        messages.append(f"Unzipped: {file_path} to {extract_to}")
+    return messages
+
 def unzip_files(folder_path):
     print("Unzipping files...")
-    for item in os.listdir(folder_path):
-        if item.endswith('.zip'):
-            file_path = os.path.join(folder_path, item)
-            game_name = re.sub(r'\[.*?\]', '', item).replace('.zip', '').strip()
-            game_name = sanitize_name(game_name)  # Sanitize game name here
-            extract_to = os.path.join(folder_path, game_name)
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_to)
-                print(f"Unzipped: {file_path} to {extract_to}")
+    # Zips that sanitize to the same game name share a folder, so they are extracted by the same worker
+    archives = {}
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.name.endswith('.zip'):
+                game_name = strip_brackets(entry.name).replace('.zip', '').strip()
+                game_name = sanitize_name(game_name)  # Sanitize game name here
+                extract_to = os.path.join(folder_path, game_name)
+                archives.setdefault(extract_to, []).append(entry.path)
+
+    with ProcessPoolExecutor() as executor:
+        for messages in executor.map(unzip_archives, archives.keys(), archives.values()):
+            for message in messages:
+                print(message)
+
+def walk_pchtxt(path):
+    # Yield (directory, filename) for every pchtxt below path, reusing the file type cached by scandir
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.pchtxt'):
+                yield path, entry.name
+    for subdir in subdirs:
+        yield from walk_pchtxt(subdir)
 
 def create_formatted_structure(folder_path):
     formatted_path = os.path.join(folder_path, 'formatted')
@@ -30,29 +74,38 @@ def create_formatted_structure(folder_path):
         os.makedirs(formatted_path)
     print(f"Creating formatted structure at: {formatted_path}")
 
-    for game_dir in os.listdir(folder_path):
-        game_dir_path = os.path.join(folder_path, game_dir)
-        if os.path.isdir(game_dir_path) and game_dir != 'formatted':
-            for root, dirs, files in os.walk(game_dir_path):
-                for file in files:
-                    if file.endswith('.pchtxt'):
-                        relative_path = os.path.relpath(root, folder_path)
-                        mod_name_match = re.search(r'\[(.*?)\]', relative_path)
-                        if mod_name_match:
-                            mod_name_with_version = mod_name_match.group(1)
-                            mod_name = re.sub(r' v[0-9.]+$', '', mod_name_with_version).strip()
-                            mod_name = sanitize_name(mod_name)  # Sanitize mod name here
-                            game_name = sanitize_name(game_dir)  # Sanitize game name here
-                            version = file.replace('.pchtxt', '').strip()
-                            
-                            new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
-                            if not os.path.exists(new_dir):
-                                os.makedirs(new_dir)
-                                print(f"Created directory: {new_dir}")
-                            
-                            shutil.move(os.path.join(root, file), os.path.join(new_dir, f"{version}.pchtxt"))
-                            print(f"Moved {file} to {os.path.join(new_dir, f'{version}.pchtxt')}")
-            shutil.rmtree(game_dir_path)  # Remove the extracted game directory after processing
+    # Collect the moves first so each target directory is created once before moving in parallel
+    moves = {}
+    new_dirs = set()
+    with os.scandir(folder_path) as entries:
+        game_dirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False) and entry.name != 'formatted']
+    for game_dir in game_dirs:
+        game_name = sanitize_name(game_dir.name)  # Sanitize game name here
+        for root, file in walk_pchtxt(game_dir.path):
+            relative_path = os.path.relpath(root, folder_path)
+            mod_name_match = _BRACKET_GROUP_RE.search(relative_path)
+            if mod_name_match:
+                mod_name_with_version = mod_name_match.group(1)
+                mod_name = _VERSION_SUFFIX_RE.sub('', mod_name_with_version).strip()
+                mod_name = sanitize_name(mod_name)  # Sanitize mod name here
+                version = file.replace('.pchtxt', '').strip()
+                
+                new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
+                new_dirs.add(new_dir)
+                moves[os.path.join(new_dir, f"{version}.pchtxt")] = os.path.join(root, file)
+
+    for new_dir in sorted(new_dirs):
+        if not os.path.exists(new_dir):
+            os.makedirs(new_dir)
+            print(f"Created directory: {new_dir}")
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(shutil.move, moves.values(), moves.keys()))
+    # Report all moves in a single write rather than one line-buffered print per file
+    sys.stdout.write(''.join(f"Moved {os.path.basename(source_file)} to {destination_file}\n" for destination_file, source_file in moves.items()))
+
+    for game_dir in game_dirs:
+        shutil.rmtree(game_dir.path)  # Remove the extracted game directory after processing
 
 def main(folder_path):
     unzip_files(folder_path)
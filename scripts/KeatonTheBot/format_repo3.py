@@ -2,6 +2,17 @@ import os
 import shutil
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_VERSION_DIGIT_RE = re.compile(r' v\d+', re.ASCII)
+_SKIP_DIRS = frozenset(('formatted', '.git'))
+
+def strip_brackets(text):
+    # Most names carry no tags, so only run the regex when there is a bracket to remove
+    if '[' not in text:
+        return text
+    return _BRACKET_RE.sub('', text)
 
 def transform_game_name(game_name):
     # Move 'The' to the front if it exists
@@ -21,7 +32,7 @@ def get_game_name_and_mod_name(path, root_dir):
     game_name = parts[0]
     
     # Remove any parts within square brackets
-    game_name = re.sub(r'\[.*?\]', '', game_name).strip()
+    game_name = strip_brackets(game_name).strip()
     
     # Transform the game name
     game_name = transform_game_name(game_name)
@@ -29,8 +40,8 @@ def get_game_name_and_mod_name(path, root_dir):
     # Check for country-specific folders and adjust game name accordingly
     country = None
     for part in parts[1:]:
-        if re.search(r'\[.*?\]', part):
-            country = re.sub(r'\[.*?\]', '', part).strip()
+        if '[' in part and _BRACKET_RE.search(part):
+            country = strip_brackets(part).strip()
             parts.remove(part)
             break
 
@@ -45,7 +56,7 @@ def get_game_name_and_mod_name(path, root_dir):
         mod_name = f'Aspect Ratio {aspect_ratio}'
     else:
         # Handle versioned mod names like "Disable Fog v1"
-        if re.search(r' v\d+', parts[-1]):
+        if _VERSION_DIGIT_RE.search(parts[-1]):
             mod_name = parts[-2] + " " + parts[-1]
         else:
             # For other cases, use the immediate parent directory name
@@ -53,32 +64,52 @@ def get_game_name_and_mod_name(path, root_dir):
     
     return game_name, mod_name
 
+def link_or_copy(source_file, destination_file):
+    # The formatted pchtxt files are never edited in place, so a hardlink is as good as a copy
+    if os.path.lexists(destination_file):
+        os.remove(destination_file)
+    try:
+        os.link(source_file, destination_file)
+    except OSError:
+        # Different filesystem or no hardlink support
+        shutil.copyfile(source_file, destination_file)
+
 def create_formatted_structure(folder_path):
     formatted_path = os.path.join(folder_path, 'formatted')
     if not os.path.exists(formatted_path):
         os.makedirs(formatted_path)
     print(f"Creating formatted structure at: {formatted_path}")
 
+    # Collect the copies first so each target directory is created once before copying in parallel
+    copies = {}
+    new_dirs = set()
     for root, dirs, files in os.walk(folder_path):
-        if 'formatted' in root:
+        # Prune the output folder and VCS metadata so the walk never descends into them
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        pchtxt_files = [file for file in files if file.endswith('.pchtxt')]
+        if not pchtxt_files:
             continue
-        for file in files:
-            if file.endswith('.pchtxt'):
-                game_name, mod_name = get_game_name_and_mod_name(root, folder_path)
-                
-                version = file.replace('.pchtxt', '').strip()
-                
-                new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
-                
-                if not os.path.exists(new_dir):
-                    os.makedirs(new_dir)
-                    print(f"Created directory: {new_dir}")
-                
-                source_file = os.path.join(root, file)
-                destination_file = os.path.join(new_dir, f"{version}.pchtxt")
-                
-                shutil.copy(source_file, destination_file)
-                print(f"Copied {source_file} to {destination_file}")
+
+        # The target folder only depends on the directory, so derive it once for all of its versions
+        game_name, mod_name = get_game_name_and_mod_name(root, folder_path)
+        new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
+        new_dirs.add(new_dir)
+        for file in pchtxt_files:
+            version = file.replace('.pchtxt', '').strip()
+            
+            source_file = os.path.join(root, file)
+            destination_file = os.path.join(new_dir, f"{version}.pchtxt")
+            copies[destination_file] = source_file
+
+    for new_dir in sorted(new_dirs):
+        if not os.path.exists(new_dir):
+            os.makedirs(new_dir)
+            print(f"Created directory: {new_dir}")
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(link_or_copy, copies.values(), copies.keys()))
+    # Report all copies in a single write rather than one line-buffered print per file
+    sys.stdout.write(''.join(f"Copied {source_file} to {destination_file}\n" for destination_file, source_file in copies.items()))
 
 def main(folder_path):
     create_formatted_structure(folder_path)
@@ -2,6 +2,17 @@ import os
 import shutil
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_VERSION_SUFFIX_RE = re.compile(r' v[0-9.]+$')
+_SKIP_DIRS = frozenset(('formatted', '.git'))
+
+def strip_brackets(text):
+    # Most names carry no tags, so only run the regex when there is a bracket to remove
+    if '[' not in text:
+        return text
+    return _BRACKET_RE.sub('', text)
 
 def get_game_name_and_mod_name(path, root_dir):
     relative_path = os.path.relpath(path, root_dir)
@@ -9,54 +20,77 @@ def get_game_name_and_mod_name(path, root_dir):
     game_name = parts[0]
     
     # Remove any parts within square brackets
-    game_name = re.sub(r'\[.*?\]', '', game_name).strip()
+    game_name = strip_brackets(game_name).strip()
     
-    # Check for country-specific folders and adjust game name accordingly
+    # Check for country-specific folders and adjust game name accordingly, collecting
+    # the remaining folders for the mod name in the same pass
     country = None
+    mod_name_parts = []
     for part in parts[1:]:
-        if re.search(r'\[.*?\]', part):
-            country = re.sub(r'\[.*?\]', '', part).strip()
-            parts.remove(part)
-            break
+        if country is None and '[' in part and _BRACKET_RE.search(part):
+            country = strip_brackets(part).strip()
+        else:
+            mod_name_parts.append(strip_brackets(part).strip())
 
     if country:
         game_name = f"{game_name} ({country})"
     else:
         game_name = game_name.strip()
 
-    mod_name_parts = parts[1:]
-    mod_name_parts = [re.sub(r'\[.*?\]', '', part).strip() for part in mod_name_parts]
     mod_name = " ".join(mod_name_parts).strip()
     
     return game_name, mod_name
 
+def link_or_copy(source_file, destination_file):
+    # The formatted pchtxt files are never edited in place, so a hardlink is as good as a copy
+    if os.path.lexists(destination_file):
+        os.remove(destination_file)
+    try:
+        os.link(source_file, destination_file)
+    except OSError:
+        # Different filesystem or no hardlink support
+        shutil.copyfile(source_file, destination_file)
+
 def create_formatted_structure(folder_path):
     formatted_path = os.path.join(folder_path, 'formatted')
     if not os.path.exists(formatted_path):
         os.makedirs(formatted_path)
     print(f"Creating formatted structure at: {formatted_path}")
 
+    # Collect the copies first so each target directory is created once before copying in parallel
+    copies = {}
+    new_dirs = set()
     for root, dirs, files in os.walk(folder_path):
-        if 'formatted' in root:
+        # Prune the output folder and VCS metadata so the walk never descends into them
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        pchtxt_files = [file for file in files if file.endswith('.pchtxt')]
+        if not pchtxt_files:
             continue
-        for file in files:
-            if file.endswith('.pchtxt'):
-                game_name, mod_name = get_game_name_and_mod_name(root, folder_path)
-                
-                # Handle nested folders for aspect ratios and similar cases
-                if 'Aspect Ratio' in root:
-                    mod_name = 'Aspect Ratio ' + os.path.basename(root)
-                
-                version = file.replace('.pchtxt', '').strip()
-                mod_name = re.sub(r' v[0-9.]+$', '', mod_name).strip()
-                
-                new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
-                if not os.path.exists(new_dir):
-                    os.makedirs(new_dir)
-                    print(f"Created directory: {new_dir}")
-                
-                shutil.copy(os.path.join(root, file), os.path.join(new_dir, f"{version}.pchtxt"))
-                print(f"Copied {file} to {os.path.join(new_dir, f'{version}.pchtxt')}")
+
+        # The target folder only depends on the directory, so derive it once for all of its versions
+        game_name, mod_name = get_game_name_and_mod_name(root, folder_path)
+        
+        # Handle nested folders for aspect ratios and similar cases
+        if 'Aspect Ratio' in root:
+            mod_name = 'Aspect Ratio ' + os.path.basename(root)
+        
+        mod_name = _VERSION_SUFFIX_RE.sub('', mod_name).strip()
+        
+        new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
+        new_dirs.add(new_dir)
+        for file in pchtxt_files:
+            version = file.replace('.pchtxt', '').strip()
+            copies[os.path.join(new_dir, f"{version}.pchtxt")] = os.path.join(root, file)
+
+    for new_dir in sorted(new_dirs):
+        if not os.path.exists(new_dir):
+            os.makedirs(new_dir)
+            print(f"Created directory: {new_dir}")
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(link_or_copy, copies.values(), copies.keys()))
+    # Report all copies in a single write rather than one line-buffered print per file
+    sys.stdout.write(''.join(f"Copied {os.path.basename(source_file)} to {destination_file}\n" for destination_file, source_file in copies.items()))
 
 def main(folder_path):
     create_formatted_structure(folder_path)
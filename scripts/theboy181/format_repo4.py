@@ -3,6 +3,18 @@ import shutil
 import re
 import sys
 import rarfile
+from concurrent.futures import ThreadPoolExecutor
+
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_VERSION_DIGIT_RE = re.compile(r' v\d+', re.ASCII)
+_SKIP_DIRS = frozenset(('formatted', '.git'))
+_MOD_NAME_TABLE = str.maketrans({"'": ".", "`": ".", ":": None})
+
+def strip_brackets(text):
+    # Most names carry no tags, so only run the regex when there is a bracket to remove
+    if '[' not in text:
+        return text
+    return _BRACKET_RE.sub('', text)
 
 def transform_game_name(game_name):
     # Move 'The' to the front if it exists
@@ -16,16 +28,30 @@ def transform_game_name(game_name):
     # Remove any '/'
     game_name = game_name.replace(':', '')
 
-    print("Game Name "+game_name)
     return game_name
 
-def extract_rar_files(folder_path):
+def extract_rar_archives(rar_paths):
+    for rar_path in rar_paths:
+        with rarfile.RarFile(rar_path) as rf:
+            # Only the pchtxt files are formatted, so skip decompressing everything else
+            members = [info for info in rf.infolist() if info.filename.endswith('.pchtxt')]
+            rf.extractall(os.path.dirname(rar_path), members)
+    return rar_paths
+
+def iter_rar_archives(folder_path):
+    # Archives in the same folder extract into it, so each folder's archives are yielded as one task
     for root, dirs, files in os.walk(folder_path):
-        for file in files:
-            if file.endswith('.rar'):
-                rar_path = os.path.join(root, file)
-                with rarfile.RarFile(rar_path) as rf:
-                    rf.extractall(root)
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        rar_paths = [os.path.join(root, file) for file in files if file.endswith('.rar')]
+        if rar_paths:
+            yield rar_paths
+
+def extract_rar_files(folder_path):
+    # The decompression itself runs in unrar, so threads are enough to overlap archives, and
+    # tasks are submitted as the walk finds them rather than after it finishes
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for rar_paths in executor.map(extract_rar_archives, iter_rar_archives(folder_path)):
+            for rar_path in rar_paths:
                 print(f"Extracted {rar_path}")
 
 def get_game_name_and_mod_name(path, root_dir):
@@ -36,7 +62,7 @@ def get_game_name_and_mod_name(path, root_dir):
     game_name = parts[0]
     
     # Remove any parts within square brackets
-    game_name = re.sub(r'\[.*?\]', '', game_name).strip()
+    game_name = strip_brackets(game_name).strip()
     
     # Transform the game name
     game_name = transform_game_name(game_name)
@@ -44,8 +70,8 @@ def get_game_name_and_mod_name(path, root_dir):
     # Check for country-specific folders and adjust game name accordingly
     country = None
     for part in parts[1:]:
-        if re.search(r'\[.*?\]', part):
-            country = re.sub(r'\[.*?\]', '', part).strip()
+        if '[' in part and _BRACKET_RE.search(part):
+            country = strip_brackets(part).strip()
             parts.remove(part)
             break
 
@@ -56,26 +82,34 @@ def get_game_name_and_mod_name(path, root_dir):
 
     # Handle Aspect Ratio mods specifically
     if 'Aspect Ratio' in relative_path:
-        aspect_ratio = os.path.basename(os.path.dirname(path)).replace("'", ".").replace("`", ".")
+        aspect_ratio = os.path.basename(os.path.dirname(path))
         mod_name = f'Aspect Ratio {aspect_ratio}'
     else:
         # Handle versioned mod names like "Disable Fog v1"
-        if re.search(r' v\d+', parts[-1]):
+        if _VERSION_DIGIT_RE.search(parts[-1]):
             mod_name = parts[-2] + " " + parts[-1]
         else:
             # For other cases, use the immediate parent directory name
             mod_name = parts[-2]
     
-    # Replace ` and ' with . in the mod name
-    mod_name = mod_name.replace("'", ".").replace("`", ".").replace("21-9", "21.9")
-    # Remove any '/' from mod name
-    mod_name = mod_name.replace(':', '')
+    # Replace ` and ' with . and remove any ':' in the mod name in a single pass
+    mod_name = mod_name.translate(_MOD_NAME_TABLE).replace("21-9", "21.9")
 
     # For handling the outlier mod (missing name) on the repo
     mod_name = mod_name.replace("Trailblazers", "4K")
 
     return game_name, mod_name
 
+def link_or_copy(source_file, destination_file):
+    # The formatted pchtxt files are never edited in place, so a hardlink is as good as a copy
+    if os.path.lexists(destination_file):
+        os.remove(destination_file)
+    try:
+        os.link(source_file, destination_file)
+    except OSError:
+        # Different filesystem or no hardlink support
+        shutil.copyfile(source_file, destination_file)
+
 def create_formatted_structure(folder_path):
     extract_rar_files(folder_path)
     
@@ -84,26 +118,34 @@ def create_formatted_structure(folder_path):
         os.makedirs(formatted_path)
     #print(f"Creating formatted structure at: {formatted_path}")
 
+    # Collect the copies first so each target directory is created once before copying in parallel
+    copies = {}
+    new_dirs = set()
     for root, dirs, files in os.walk(folder_path):
-        if 'formatted' in root:
+        # Prune the output folder and VCS metadata so the walk never descends into them
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        pchtxt_files = [file for file in files if file.endswith('.pchtxt')]
+        if not pchtxt_files:
             continue
-        for file in files:
-            if file.endswith('.pchtxt'):
-                game_name, mod_name = get_game_name_and_mod_name(root, folder_path)
-                
-                version = file.replace('.pchtxt', '').strip()
-                
-                new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
-                
-                if not os.path.exists(new_dir):
-                    os.makedirs(new_dir)
-                    #print(f"Created directory: {new_dir}")
-                
-                source_file = os.path.join(root, file)
-                destination_file = os.path.join(new_dir, f"{version}.pchtxt")
-                
-                shutil.copy(source_file, destination_file)
-                #print(f"Copied {source_file} to {destination_file}")
+
+        # The target folder only depends on the directory, so derive it once for all of its versions
+        game_name, mod_name = get_game_name_and_mod_name(root, folder_path)
+        new_dir = os.path.join(formatted_path, f"{game_name} - {mod_name}")
+        new_dirs.add(new_dir)
+        for file in pchtxt_files:
+            version = file.replace('.pchtxt', '').strip()
+            
+            source_file = os.path.join(root, file)
+            destination_file = os.path.join(new_dir, f"{version}.pchtxt")
+            copies[destination_file] = source_file
+
+    for new_dir in sorted(new_dirs):
+        if not os.path.exists(new_dir):
+            os.makedirs(new_dir)
+            #print(f"Created directory: {new_dir}")
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(link_or_copy, copies.values(), copies.keys()))
 
 def main(folder_path):
     create_formatted_structure(folder_path)